@@ -7,7 +7,6 @@ Usage:
     python -m src.evaluate
 """
 import pathlib
-import pickle
 
 import matplotlib
 
@@ -17,14 +16,14 @@ import numpy as np
 import pandas as pd
 from sklearn.metrics import classification_report, confusion_matrix
 
+from src.predict import load_model
+
 
 def main() -> None:
     root = pathlib.Path(__file__).resolve().parent.parent
-    with open(root / "model.pkl", "rb") as f:
-        data = pickle.load(f)
-    model, vectorizer = data["model"], data["vectorizer"]
+    model, vectorizer = load_model(str(root / "model.pkl"))
 
-    test = pd.read_csv(root / "data" / "test.csv")
+    test = pd.read_csv(root / "data" / "test.csv", engine="pyarrow")
     X = vectorizer.transform(test["message"].fillna(""))
     y_true = test["label"]
     y_pred = model.predict(X)
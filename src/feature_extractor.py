@@ -5,6 +5,7 @@ Adds specific features for Russian and English spam patterns.
 
 import re
 import numpy as np
+from scipy import sparse
 from sklearn.base import BaseEstimator, TransformerMixin
 
 
@@ -14,6 +15,19 @@ class SpamFeatureExtractor(BaseEstimator, TransformerMixin):
     Works for both English and Russian text.
     """
     
+    # Output columns of transform, in order
+    FEATURE_NAMES = (
+        'length', 'word_count', 'avg_word_length',
+        'has_url', 'has_russian_phone', 'has_intl_phone',
+        'has_money_ru', 'has_money_en',
+        'exclamation_count', 'question_count',
+        'caps_ratio', 'digit_ratio',
+        'russian_spam_words', 'english_spam_words',
+        'has_cyrillic', 'has_latin',
+        'has_win_pattern', 'has_urgent_pattern',
+        'has_free_pattern', 'has_click_pattern', 'has_block_pattern'
+    )
+    
     def __init__(self):
         # Russian spam keywords
         self.russian_spam_keywords = [
@@ -30,6 +44,11 @@ class SpamFeatureExtractor(BaseEstimator, TransformerMixin):
             'offer', 'guaranteed', 'cash', 'credit', 'loan'
         ]
         
+        # Keyword matchers: one alternation per language, so a single scan
+        # over the message counts hits for every keyword
+        self.russian_keyword_pattern = re.compile('|'.join(map(re.escape, self.russian_spam_keywords)))
+        self.english_keyword_pattern = re.compile('|'.join(map(re.escape, self.english_spam_keywords)))
+        
         # URL patterns
         self.url_pattern = re.compile(r'http[s]?://|www\.|\.com|\.ru|\.net|\.org')
         
@@ -38,71 +57,86 @@ class SpamFeatureExtractor(BaseEstimator, TransformerMixin):
         self.intl_phone_pattern = re.compile(r'\d{3,4}-\d{3,4}|\d{5,}')
         
         # Money patterns
-        self.money_pattern_ru = re.compile(r'\d+\s?(руб|тыс|млн|₽)|р\.|рубл')
-        self.money_pattern_en = re.compile(r'\$\d+|£\d+|€\d+|\d+\s?(dollar|pound|euro)')
+        self.money_pattern_ru = re.compile(r'\d+\s?(?:руб|тыс|млн|₽)|р\.|рубл')
+        self.money_pattern_en = re.compile(r'\$\d+|£\d+|€\d+|\d+\s?(?:dollar|pound|euro)')
+        
+        # Capital letters (Latin + Cyrillic) and ASCII digits for the ratios
+        self.caps_pattern = re.compile('[A-ZА-ЯЁ]')
+        self.digit_pattern = re.compile('[0-9]')
+        
+        # Script patterns (simple language detection)
+        self.cyrillic_pattern = re.compile('[а-яА-Я]')
+        self.latin_pattern = re.compile('[a-zA-Z]')
+        
+        # Specific spam patterns
+        self.win_pattern = re.compile(r'выигра|won|winner')
+        self.urgent_pattern = re.compile(r'срочно|urgent|attention|внимание')
+        self.free_pattern = re.compile(r'бесплатно|free|даром')
+        self.click_pattern = re.compile(r'кликни|нажми|click|tap')
+        self.block_pattern = re.compile(r'заблокирован|blocked|suspend')
     
     def fit(self, X, y=None):
         return self
     
     def transform(self, X):
-        """Extract features from text messages"""
-        features = []
+        """
+        Extract features from text messages.
+        
+        Returns a float32 CSR matrix so it can be stacked with the sparse
+        TF-IDF features without densifying; most indicator columns are zero.
+        """
+        # A plain loop over the precompiled patterns: prediction usually passes
+        # a single message, where per-call pandas overhead would dominate
+        texts = X.tolist() if hasattr(X, 'tolist') else list(X)
         
-        for text in X:
+        rows = []
+        for text in texts:
             text_lower = text.lower()
+            length = len(text)
+            words = text.split()
             
-            feature_dict = {
+            rows.append((
                 # Text characteristics
-                'length': len(text),
-                'word_count': len(text.split()),
-                'avg_word_length': np.mean([len(word) for word in text.split()]) if text else 0,
+                length,
+                len(words),
+                sum(map(len, words)) / len(words) if words else 0,
                 
                 # Spam indicators
-                'has_url': 1 if self.url_pattern.search(text_lower) else 0,
-                'has_russian_phone': 1 if self.russian_phone_pattern.search(text) else 0,
-                'has_intl_phone': 1 if self.intl_phone_pattern.search(text) else 0,
-                'has_money_ru': 1 if self.money_pattern_ru.search(text_lower) else 0,
-                'has_money_en': 1 if self.money_pattern_en.search(text_lower) else 0,
+                self.url_pattern.search(text_lower) is not None,
+                self.russian_phone_pattern.search(text) is not None,
+                self.intl_phone_pattern.search(text) is not None,
+                self.money_pattern_ru.search(text_lower) is not None,
+                self.money_pattern_en.search(text_lower) is not None,
                 
                 # Character patterns
-                'exclamation_count': text.count('!'),
-                'question_count': text.count('?'),
-                'caps_ratio': sum(1 for c in text if c.isupper()) / len(text) if text else 0,
-                'digit_ratio': sum(1 for c in text if c.isdigit()) / len(text) if text else 0,
+                text.count('!'),
+                text.count('?'),
+                len(self.caps_pattern.findall(text)) / length if length else 0,
+                len(self.digit_pattern.findall(text)) / length if length else 0,
                 
                 # Keyword matching
-                'russian_spam_words': sum(1 for word in self.russian_spam_keywords if word in text_lower),
-                'english_spam_words': sum(1 for word in self.english_spam_keywords if word in text_lower),
+                len(self.russian_keyword_pattern.findall(text_lower)),
+                len(self.english_keyword_pattern.findall(text_lower)),
                 
                 # Language detection (simple)
-                'has_cyrillic': 1 if re.search('[а-яА-Я]', text) else 0,
-                'has_latin': 1 if re.search('[a-zA-Z]', text) else 0,
+                self.cyrillic_pattern.search(text) is not None,
+                self.latin_pattern.search(text) is not None,
                 
                 # Specific spam patterns
-                'has_win_pattern': 1 if re.search(r'(выигра|won|winner)', text_lower) else 0,
-                'has_urgent_pattern': 1 if re.search(r'(срочно|urgent|attention|внимание)', text_lower) else 0,
-                'has_free_pattern': 1 if re.search(r'(бесплатно|free|даром)', text_lower) else 0,
-                'has_click_pattern': 1 if re.search(r'(кликни|нажми|click|tap)', text_lower) else 0,
-                'has_block_pattern': 1 if re.search(r'(заблокирован|blocked|suspend)', text_lower) else 0,
-            }
-            
-            features.append(list(feature_dict.values()))
+                self.win_pattern.search(text_lower) is not None,
+                self.urgent_pattern.search(text_lower) is not None,
+                self.free_pattern.search(text_lower) is not None,
+                self.click_pattern.search(text_lower) is not None,
+                self.block_pattern.search(text_lower) is not None,
+            ))
         
-        return np.array(features)
+        # Row layout follows FEATURE_NAMES
+        features = np.array(rows, dtype=np.float32).reshape(len(rows), len(self.FEATURE_NAMES))
+        return sparse.csr_matrix(features)
     
     def get_feature_names(self):
         """Return feature names for interpretability"""
-        return [
-            'length', 'word_count', 'avg_word_length',
-            'has_url', 'has_russian_phone', 'has_intl_phone',
-            'has_money_ru', 'has_money_en',
-            'exclamation_count', 'question_count',
-            'caps_ratio', 'digit_ratio',
-            'russian_spam_words', 'english_spam_words',
-            'has_cyrillic', 'has_latin',
-            'has_win_pattern', 'has_urgent_pattern',
-            'has_free_pattern', 'has_click_pattern', 'has_block_pattern'
-        ]
+        return list(self.FEATURE_NAMES)
 
 
 def add_spam_features(messages):
@@ -113,7 +147,7 @@ def add_spam_features(messages):
         messages: List or Series of text messages
         
     Returns:
-        numpy array of extracted features
+        scipy.sparse CSR matrix of extracted features
     """
     extractor = SpamFeatureExtractor()
     return extractor.fit_transform(messages)
@@ -5,7 +5,11 @@ This module merges the russian_messages.csv file with the main raw.csv,
 creating an extended multilingual dataset for model training.
 """
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import shutil
+from pyarrow import csv as pacsv
 from pathlib import Path
 
 
@@ -24,44 +28,53 @@ def merge_datasets():
     
     print("📂 Loading data...")
     
+    # Load only the label/message columns; the trailing empty columns
+    # are never used, so they are not parsed or copied at all
+    columns = {'v1': 'label', 'v2': 'message'}
+    
     # Load main dataset (English)
-    df_english = pd.read_csv(raw_file, encoding='latin-1')
+    df_english = pd.read_csv(raw_file, encoding='latin-1', usecols=list(columns), engine='pyarrow')
     print(f"✓ Loaded English messages: {len(df_english)}")
     
     # Load Russian language messages
-    df_russian = pd.read_csv(russian_file, encoding='utf-8')
+    df_russian = pd.read_csv(russian_file, encoding='utf-8', usecols=list(columns), engine='pyarrow')
     print(f"✓ Loaded Russian messages: {len(df_russian)}")
     
-    # Keep only necessary columns
-    df_english = df_english[['v1', 'v2']].copy()
-    df_russian = df_russian[['v1', 'v2']].copy()
-    
     # Rename columns for convenience
-    df_english.columns = ['label', 'message']
-    df_russian.columns = ['label', 'message']
+    df_english = df_english.rename(columns=columns)
+    df_russian = df_russian.rename(columns=columns)
     
     # Add language label
     df_english['language'] = 'en'
     df_russian['language'] = 'ru'
     
-    # Combine datasets
+    # Combine datasets; language has only two values, so store it as a
+    # categorical (1-byte codes) rather than a string column
     df_combined = pd.concat([df_english, df_russian], ignore_index=True)
+    df_combined['language'] = df_combined['language'].astype('category')
     
-    # Shuffle data
-    df_combined = df_combined.sample(frac=1, random_state=42).reset_index(drop=True)
+    # Shuffle data: one row take with a seeded permutation, then a fresh
+    # RangeIndex instead of reset_index allocating a new frame
+    permutation = np.random.default_rng(42).permutation(len(df_combined))
+    df_combined = df_combined.take(permutation)
+    df_combined.index = pd.RangeIndex(len(df_combined))
     
-    # Save result
-    df_combined.to_csv(output_file, index=False, encoding='utf-8')
+    # Save result (Arrow's CSV writer is multi-threaded and always UTF-8)
+    pacsv.write_csv(pa.Table.from_pandas(df_combined, preserve_index=False), output_file)
     print(f"\n✓ Combined dataset saved: {output_file}")
     
-    # Statistics
+    # Statistics (one counting pass per column)
+    total = len(df_combined)
+    label_counts = df_combined['label'].value_counts()
+    language_counts = df_combined['language'].value_counts()
+    
     print("\n📊 Combined dataset statistics:")
-    print(f"   Total messages: {len(df_combined)}")
-    print(f"   Spam: {len(df_combined[df_combined['label'] == 'spam'])} ({len(df_combined[df_combined['label'] == 'spam'])/len(df_combined)*100:.1f}%)")
-    print(f"   Ham: {len(df_combined[df_combined['label'] == 'ham'])} ({len(df_combined[df_combined['label'] == 'ham'])/len(df_combined)*100:.1f}%)")
+    print(f"   Total messages: {total}")
+    print(f"   Spam: {label_counts.get('spam', 0)} ({label_counts.get('spam', 0)/total*100:.1f}%)")
+    print(f"   Ham: {label_counts.get('ham', 0)} ({label_counts.get('ham', 0)/total*100:.1f}%)")
     print(f"\n   By language:")
-    print(f"   English: {len(df_combined[df_combined['language'] == 'en'])}")
-    print(f"   Russian: {len(df_combined[df_combined['language'] == 'ru'])}")
+    print(f"   English: {language_counts.get('en', 0)}")
+    print(f"   Russian: {language_counts.get('ru', 0)}")
     
     return df_combined
 
@@ -72,9 +85,9 @@ def create_backup():
     raw_file = data_dir / "raw.csv"
     backup_file = data_dir / "raw_english_only.csv"
     
-    if not backup_file.exists():
-        df = pd.read_csv(raw_file, encoding='latin-1')
-        df.to_csv(backup_file, index=False, encoding='latin-1')
+    # A byte-for-byte copy; no need to parse and re-serialize the CSV
+    if not backup_file.exists() and raw_file.exists():
+        shutil.copyfile(raw_file, backup_file)
         print(f"✓ Backup created: {backup_file}")
 
 
@@ -90,18 +103,17 @@ def update_raw_file():
     
     if multilingual_file.exists():
         # Read multilingual dataset
-        df = pd.read_csv(multilingual_file, encoding='utf-8')
+        df = pd.read_csv(multilingual_file, encoding='utf-8', engine='pyarrow')
         
-        # Convert to original raw.csv format
-        df_output = pd.DataFrame()
-        df_output['v1'] = df['label']
-        df_output['v2'] = df['message']
-        df_output['v3'] = ''
-        df_output['v4'] = ''
-        df_output['v5'] = ''
+        # Convert to raw.csv format in a single construction. The original
+        # dataset's empty v3-v5 columns are never read, so they are dropped
+        df_output = pd.DataFrame({
+            'v1': df['label'].to_numpy(),
+            'v2': df['message'].to_numpy(),
+        }, copy=False)
         
         # Save
-        df_output.to_csv(raw_file, index=False, encoding='utf-8')
+        pacsv.write_csv(pa.Table.from_pandas(df_output, preserve_index=False), raw_file)
         print(f"✓ File {raw_file} updated with multilingual data")
     else:
         print(f"✗ File {multilingual_file} not found. Run merge_datasets() first")
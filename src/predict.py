@@ -3,19 +3,89 @@ Prediction script for SMS Spam Classifier.
 Loads trained model and classifies text from stdin or command line.
 """
 
-import pickle
+import os
 import sys
+from functools import lru_cache
+
+import joblib
+import numpy as np
+from sklearn.feature_extraction.text import TfidfTransformer, TfidfVectorizer
 
 from src.prepare import clean_text
 
 
+def _idf_steps(vectorizer):
+    """Return the fitted TF-IDF steps inside a (possibly composite) vectorizer."""
+    candidates = [vectorizer, *vectorizer.get_params(deep=True).values()]
+    return [
+        step for step in candidates
+        if isinstance(step, (TfidfVectorizer, TfidfTransformer)) and hasattr(step, 'idf_')
+    ]
+
+
+def save_model(bundle, model_path='model.pkl'):
+    """
+    Save a trained model bundle to disk.
+    
+    The bundle is written uncompressed with joblib, which stores NumPy
+    arrays as raw blocks that load_model memory-maps instead of copying.
+    Model coefficients are stored as float32 and IDF weights as float16 to
+    shrink the file; both are used as stored, so nothing is converted at
+    load time. The model and vectorizer passed in are left unchanged.
+    
+    The file is written next to model_path and then renamed over it, so
+    a reader never sees a partially written model and processes that
+    still have the old model memory-mapped keep reading the old file.
+    
+    Args:
+        bundle: Dict with at least 'model' and 'vectorizer' entries
+        model_path: Path to write the model to
+    """
+    model = bundle['model']
+    coef = model.coef_
+    steps = _idf_steps(bundle['vectorizer'])
+    originals = [step.idf_ for step in steps]
+    try:
+        model.coef_ = coef.astype(np.float32)
+        for step, idf in zip(steps, originals):
+            step.idf_ = idf.astype(np.float16)
+        tmp_path = f'{model_path}.tmp'
+        joblib.dump(bundle, tmp_path, protocol=5)
+        os.replace(tmp_path, model_path)
+    finally:
+        model.coef_ = coef
+        for step, idf in zip(steps, originals):
+            step.idf_ = idf
+
+
 def load_model(model_path='model.pkl'):
-    """Load the trained model and vectorizer."""
-    with open(model_path, 'rb') as f:
-        data = pickle.load(f)
+    """
+    Load the trained model and vectorizer.
+    
+    The result is cached per absolute model path, so load_model(),
+    load_model('model.pkl') and load_model('./model.pkl') share one entry
+    and repeated predictions only read the model once. Call
+    load_model.cache_clear() after retraining in the same process.
+    
+    Large arrays such as the model coefficients and IDF weights are
+    memory-mapped read-only, so start-up does not copy them and forked
+    workers share the same pages. The float16 IDF weights are upcast per
+    lookup inside TfidfTransformer, which gives the same float32 features.
+    """
+    return _load_model(os.path.abspath(model_path))
+
+
+@lru_cache(maxsize=4)
+def _load_model(model_path):
+    """Load and cache the model bundle at an absolute path."""
+    data = joblib.load(model_path, mmap_mode='r')
     return data['model'], data['vectorizer']
 
 
+load_model.cache_clear = _load_model.cache_clear
+load_model.cache_info = _load_model.cache_info
+
+
 def predict(text, model_path='model.pkl'):
     """
     Predict whether a text message is spam or ham.
@@ -27,17 +97,39 @@ def predict(text, model_path='model.pkl'):
     Returns:
         'spam' or 'ham'
     """
-    # Load model
-    model, vectorizer = load_model(model_path)
+    return predict_batch([text], model_path)[0]
 
+
+def predict_batch(texts, model_path='model.pkl'):
+    """
+    Predict spam/ham labels for many messages at once.
+    
+    The whole batch goes through a single vectorizer and model call, so the
+    fixed per-call overhead is paid once instead of once per message.
+    
+    Args:
+        texts: Iterable of message texts to classify
+        model_path: Path to trained model
+        
+    Returns:
+        List of 'spam' or 'ham', one per message
+    """
     # Apply the same preprocessing as training — otherwise the vectorizer
     # sees raw text while it was fitted on cleaned text (silent skew)
-    text_features = vectorizer.transform([clean_text(text)])
+    cleaned = [clean_text(text) for text in texts]
+    if not cleaned:
+        return []
+    
+    # Load model
+    model, vectorizer = load_model(model_path)
     
-    # Predict
-    prediction = model.predict(text_features)[0]
+    text_features = vectorizer.transform(cleaned)
     
-    return prediction
+    # Score with the linear model directly: the same decision rule as
+    # model.predict for binary logistic regression, without its per-call
+    # input validation
+    scores = text_features @ model.coef_.ravel() + model.intercept_[0]
+    return np.where(scores > 0, model.classes_[1], model.classes_[0]).tolist()
 
 
 def main():
@@ -10,7 +10,9 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.predict import predict_message, predict_proba
+from src.predict import predict_batch
+
+MODEL_PATH = Path(__file__).parent.parent / "model.pkl"
 
 
 def print_header(text):
@@ -20,24 +22,23 @@ def print_header(text):
     print("=" * 70)
 
 
-def test_message(message, expected=None):
-    """Test a message and display the result"""
-    result = predict_message(message)
-    proba = predict_proba(message)
-    
-    # Choose emoji
-    emoji = "❌" if result == "spam" else "✅"
-    
-    # Format result with color
-    result_str = f"{emoji} {result.upper()}"
-    
-    print(f"\n📱 Message: \"{message}\"")
-    print(f"   Result: {result_str}")
-    print(f"   Probabilities: HAM={proba['ham']:.2%}, SPAM={proba['spam']:.2%}")
-    
-    if expected:
-        match = "✓" if result == expected else "✗"
-        print(f"   Expected: {expected.upper()} {match}")
+def test_messages(messages, expected=None):
+    """Classify a group of messages in one batch and display the results"""
+    results = predict_batch(messages, model_path=str(MODEL_PATH))
+    
+    for message, result in zip(messages, results):
+        # Choose emoji
+        emoji = "❌" if result == "spam" else "✅"
+        
+        # Format result with color
+        result_str = f"{emoji} {result.upper()}"
+        
+        print(f"\n📱 Message: \"{message}\"")
+        print(f"   Result: {result_str}")
+        
+        if expected:
+            match = "✓" if result == expected else "✗"
+            print(f"   Expected: {expected.upper()} {match}")
 
 
 def main():
@@ -47,8 +48,7 @@ def main():
     print("   Make sure the model is trained on the multilingual dataset!")
     
     # Check if model exists
-    model_path = Path(__file__).parent.parent / "models" / "model.pkl"
-    if not model_path.exists():
+    if not MODEL_PATH.exists():
         print("\n⚠️  WARNING: Model not found!")
         print("   First, train the model:")
         print("   1. python src/merge_russian_data.py --update-raw")
@@ -68,8 +68,7 @@ def main():
         "Не забудь купить молоко и хлеб по дороге домой",
     ]
     
-    for msg in ham_examples:
-        test_message(msg, expected="ham")
+    test_messages(ham_examples, expected="ham")
     
     # SPAM examples
     print_header("❌ SPAM EXAMPLES (FRAUDULENT MESSAGES)")
@@ -83,8 +82,7 @@ def main():
         "БЕСПЛАТНАЯ раздача денег! Первым 100 участникам по 10000 руб!",
     ]
     
-    for msg in spam_examples:
-        test_message(msg, expected="spam")
+    test_messages(spam_examples, expected="spam")
     
     # Edge cases
     print_header("⚠️  EDGE CASES")
@@ -96,8 +94,7 @@ def main():
         "Напоминание: платеж по кредиту 15 числа",
     ]
     
-    for msg in edge_cases:
-        test_message(msg)
+    test_messages(edge_cases)
     
     # Interactive mode
     print_header("🎮 INTERACTIVE MODE")
@@ -114,7 +111,7 @@ def main():
             if not user_input:
                 continue
             
-            test_message(user_input)
+            test_messages([user_input])
             
         except KeyboardInterrupt:
             print("\n\n👋 Goodbye!")
@@ -0,0 +1,81 @@
+"""
+Unit tests for the Flask web interface.
+Tests the batch classification endpoint and its input validation.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from ui.app import app, clear_caches, _predict_cached, MAX_BATCH_SIZE, MAX_CACHED_MESSAGE_LENGTH
+from src.predict import load_model
+
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+class TestClassifyBatch:
+    """Test cases for the /classify_batch endpoint."""
+
+    def test_classifies_each_message(self, client):
+        """Test that one label is returned per message."""
+        messages = ["Meeting tomorrow at 10am", "WIN FREE PRIZES NOW", ""]
+        response = client.post('/classify_batch', json={'messages': messages})
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['count'] == len(messages)
+        assert all(result in ['spam', 'ham'] for result in data['results'])
+
+    @pytest.mark.parametrize('payload', [
+        {},
+        {'messages': []},
+        {'messages': "not a list"},
+    ])
+    def test_missing_messages(self, client, payload):
+        """Test that a missing or empty message list is rejected."""
+        response = client.post('/classify_batch', json=payload)
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize('messages', [
+        ["hi", 123],
+        ["hi", None],
+        [["x"]],
+    ])
+    def test_non_string_messages(self, client, messages):
+        """Test that non-string messages are a client error, not a server error."""
+        response = client.post('/classify_batch', json={'messages': messages})
+        assert response.status_code == 400
+        assert 'error' in response.get_json()
+
+    def test_batch_size_limit(self, client):
+        """Test that oversized batches are rejected."""
+        messages = ["hello"] * (MAX_BATCH_SIZE + 1)
+        response = client.post('/classify_batch', json={'messages': messages})
+        assert response.status_code == 400
+
+
+class TestClassifyCache:
+    """Test cases for the /classify result cache."""
+
+    def test_long_messages_not_cached(self, client):
+        """Test that messages over the length limit bypass the cache."""
+        _predict_cached.cache_clear()
+        message = "x" * (MAX_CACHED_MESSAGE_LENGTH + 1)
+        response = client.post('/classify', json={'message': message})
+        assert response.status_code == 200
+        assert _predict_cached.cache_info().currsize == 0
+
+    def test_clear_caches(self, client):
+        """Test that clear_caches empties both the prediction and model caches."""
+        client.post('/classify', json={'message': "See you at lunch"})
+        assert _predict_cached.cache_info().currsize > 0
+        clear_caches()
+        assert _predict_cached.cache_info().currsize == 0
+        assert load_model.cache_info().currsize == 0
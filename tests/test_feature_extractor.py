@@ -0,0 +1,77 @@
+"""
+Unit tests for the spam feature extractor.
+Tests feature shape, ordering, and language-specific patterns.
+"""
+
+import numpy as np
+import pytest
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.feature_extractor import SpamFeatureExtractor
+
+
+@pytest.fixture
+def extractor():
+    return SpamFeatureExtractor()
+
+
+def features_of(extractor, text):
+    """Return the feature row for a single message as a name -> value dict."""
+    row = extractor.fit_transform([text]).toarray()[0]
+    return dict(zip(extractor.get_feature_names(), row))
+
+
+class TestSpamFeatureExtractor:
+    """Test cases for spam feature extraction."""
+
+    def test_output_shape(self, extractor):
+        """Test that one row per message and one column per feature name is returned."""
+        messages = ["hello", "WIN a FREE prize now!", "Привет, как дела?"]
+        features = extractor.fit_transform(messages)
+        assert features.shape == (3, len(extractor.get_feature_names()))
+
+    def test_text_characteristics(self, extractor):
+        """Test length, word count and character ratios."""
+        features = features_of(extractor, "Call NOW 12!")
+        assert features['length'] == 12
+        assert features['word_count'] == 3
+        assert features['avg_word_length'] == pytest.approx(10 / 3)
+        assert features['exclamation_count'] == 1
+        assert features['caps_ratio'] == pytest.approx(4 / 12)
+        assert features['digit_ratio'] == pytest.approx(2 / 12)
+
+    def test_english_spam_patterns(self, extractor):
+        """Test that English spam indicators are detected."""
+        features = features_of(extractor, "WINNER! Click www.prize.com to claim $500 FREE")
+        assert features['has_url'] == 1
+        assert features['has_money_en'] == 1
+        assert features['has_win_pattern'] == 1
+        assert features['has_click_pattern'] == 1
+        assert features['has_free_pattern'] == 1
+        assert features['has_latin'] == 1
+        assert features['has_cyrillic'] == 0
+        assert features['english_spam_words'] > 0
+
+    def test_russian_spam_patterns(self, extractor):
+        """Test that Russian spam indicators are detected."""
+        features = features_of(extractor, "СРОЧНО! Ваша карта заблокирована, позвоните 8-800-555")
+        assert features['has_russian_phone'] == 1
+        assert features['has_urgent_pattern'] == 1
+        assert features['has_block_pattern'] == 1
+        assert features['has_cyrillic'] == 1
+        assert features['russian_spam_words'] >= 3
+
+    def test_output_is_sparse_float32(self, extractor):
+        """Test that features are returned as a float32 CSR matrix."""
+        features = extractor.fit_transform(["FREE prize!", "see you at noon"])
+        assert features.format == 'csr'
+        assert features.dtype == np.float32
+
+    def test_empty_message(self, extractor):
+        """Test that an empty message yields zeros instead of NaNs."""
+        features = extractor.fit_transform([""])
+        assert features.nnz == 0
@@ -3,6 +3,7 @@ Unit tests for SMS Spam Classifier prediction module.
 Tests spam detection, ham detection, and edge cases.
 """
 
+import numpy as np
 import pytest
 import sys
 import os
@@ -10,7 +11,11 @@ import os
 # Add parent directory to path to import modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.predict import predict, clean_text
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+
+from src.predict import predict, predict_batch, clean_text, load_model, save_model
 
 
 class TestPredict:
@@ -162,6 +167,19 @@ class TestModelIntegration:
                 # Some messages might fail validation, that's ok
                 pass
     
+    def test_model_is_cached(self):
+        """Test that the model is loaded from disk only once per path."""
+        first = load_model('model.pkl')
+        second = load_model('model.pkl')
+        assert first[0] is second[0], "Model should be reused between calls"
+        assert first[1] is second[1], "Vectorizer should be reused between calls"
+    
+    def test_model_cache_ignores_path_spelling(self):
+        """Test that the default, relative and absolute paths share one cache entry."""
+        default = load_model()
+        assert load_model('model.pkl') is default
+        assert load_model(os.path.abspath('model.pkl')) is default
+    
     def test_consistency(self):
         """Test that same message always returns same prediction."""
         message = "Test message for consistency"
@@ -187,6 +205,71 @@ class TestModelIntegration:
         
         # All results should be valid
         assert all(r in ['spam', 'ham'] for r in results)
+    
+    def test_predict_batch_matches_predict(self):
+        """Test that batch prediction agrees with per-message prediction."""
+        messages = [
+            "Meeting tomorrow at 10am",
+            "WIN FREE PRIZES NOW",
+            "СРОЧНО! Вы выиграли iPhone! Перейдите по ссылке",
+            "",
+        ]
+        
+        assert predict_batch(messages) == [predict(msg) for msg in messages]
+    
+    def test_predict_batch_empty(self):
+        """Test that an empty batch returns an empty list."""
+        assert predict_batch([]) == []
+
+
+class TestSaveLoad:
+    """Test cases for the model file round trip."""
+    
+    @pytest.fixture
+    def fitted(self):
+        messages = ["win a free prize now", "free cash, call now", "see you at lunch",
+                    "running late, start without me", "claim your free reward", "thanks for the notes"]
+        labels = ["spam", "spam", "ham", "ham", "spam", "ham"]
+        vectorizer = make_pipeline(
+            HashingVectorizer(n_features=2**10, ngram_range=(2, 3), analyzer='char_wb',
+                              alternate_sign=False, norm=None, dtype=np.float32),
+            TfidfTransformer(),
+        )
+        model = LogisticRegression(solver='liblinear').fit(vectorizer.fit_transform(messages), labels)
+        return model, vectorizer, messages
+    
+    def test_caller_objects_unchanged(self, fitted, tmp_path):
+        """Test that saving leaves the caller's model and vectorizer untouched."""
+        model, vectorizer, _ = fitted
+        tfidf = vectorizer[-1]
+        coef, idf = model.coef_.copy(), tfidf.idf_.copy()
+        
+        save_model({'model': model, 'vectorizer': vectorizer}, str(tmp_path / 'model.pkl'))
+        
+        assert model.coef_.dtype == coef.dtype and np.array_equal(model.coef_, coef)
+        assert tfidf.idf_.dtype == idf.dtype and np.array_equal(tfidf.idf_, idf)
+    
+    def test_round_trip_restores_weights(self, fitted, tmp_path):
+        """Test that load_model returns the stored float32 and float16 weights."""
+        model, vectorizer, messages = fitted
+        model_path = str(tmp_path / 'model.pkl')
+        save_model({'model': model, 'vectorizer': vectorizer}, model_path)
+        loaded_model, loaded_vectorizer = load_model(model_path)
+        
+        np.testing.assert_array_equal(loaded_model.coef_, model.coef_.astype(np.float32))
+        np.testing.assert_array_equal(loaded_vectorizer[-1].idf_, vectorizer[-1].idf_.astype(np.float16))
+        assert list(loaded_model.predict(loaded_vectorizer.transform(messages))) == \
+            list(model.predict(vectorizer.transform(messages)))
+    
+    def test_weights_are_memory_mapped(self, fitted, tmp_path):
+        """Test that load_model maps the large arrays instead of copying them."""
+        model, vectorizer, _ = fitted
+        model_path = str(tmp_path / 'model.pkl')
+        save_model({'model': model, 'vectorizer': vectorizer}, model_path)
+        loaded_model, loaded_vectorizer = load_model(model_path)
+        
+        assert isinstance(loaded_model.coef_, np.memmap)
+        assert isinstance(loaded_vectorizer[-1].idf_, np.memmap)
 
 
 class TestErrorHandling:
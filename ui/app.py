@@ -4,16 +4,50 @@ Provides a simple form to classify messages.
 """
 
 from flask import Flask, render_template, request, jsonify
+from functools import lru_cache
 import sys
 import os
 
 # Add parent directory to path to import predict module
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.predict import predict
+from src.predict import load_model, predict, predict_batch
+
+# Load the model once at startup so the first request doesn't pay for it;
+# /classify still reports a missing model if training hasn't run yet
+try:
+    load_model()
+except FileNotFoundError:
+    pass
 
 app = Flask(__name__)
 
+# Largest number of messages accepted by /classify_batch in one request
+MAX_BATCH_SIZE = 1000
+
+# Longest message whose /classify result is cached; longer ones are classified
+# directly so the cache cannot hold arbitrarily large request bodies
+MAX_CACHED_MESSAGE_LENGTH = 1000
+
+
+@lru_cache(maxsize=4096)
+def _predict_cached(message):
+    """Classify a message, reusing the result for repeated identical messages."""
+    return predict(message)
+
+
+def _classify_message(message):
+    """Classify one message, caching the result only for short messages."""
+    if len(message) > MAX_CACHED_MESSAGE_LENGTH:
+        return predict(message)
+    return _predict_cached(message)
+
+
+def clear_caches():
+    """Drop the cached model and cached predictions, e.g. after retraining."""
+    load_model.cache_clear()
+    _predict_cached.cache_clear()
+
 
 @app.route('/')
 def index():
@@ -39,7 +73,7 @@ def classify():
     
     try:
         # Predict
-        result = predict(message)
+        result = _classify_message(message)
         
         # Determine if spam or ham
         is_spam = (result == 'spam')
@@ -59,5 +93,42 @@ def classify():
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/classify_batch', methods=['POST'])
+def classify_batch():
+    """
+    Handle batch classification request.
+    Accepts JSON with a 'messages' list and classifies them in one pass.
+    """
+    data = request.get_json(silent=True) or {}
+    messages = data.get('messages')
+    
+    if not messages or not isinstance(messages, list):
+        return jsonify({'error': 'No messages provided'}), 400
+    
+    if not all(isinstance(message, str) for message in messages):
+        return jsonify({'error': 'All messages must be strings'}), 400
+    
+    if len(messages) > MAX_BATCH_SIZE:
+        return jsonify({
+            'error': f'Too many messages (maximum is {MAX_BATCH_SIZE})'
+        }), 400
+    
+    try:
+        results = predict_batch(messages)
+        
+        return jsonify({
+            'results': results,
+            'count': len(results)
+        })
+    
+    except FileNotFoundError:
+        return jsonify({
+            'error': 'Model not found. Please train the model first.'
+        }), 500
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5001)